@@ -1 +1,4 @@
 from .canvas import Canvas
+from .shape import Shape
+from .framesink import FrameSink, FrameReader
+from .images import LazyImage
@@ -1,4 +1,5 @@
 from typing import Optional, Literal
+from concurrent.futures import Future, ThreadPoolExecutor
 import time
 import glfw
 import os
@@ -6,6 +7,17 @@ import skia
 from skia import Color4f, Paint, Typeface, Font, Path
 from OpenGL import GL
 import imageio_ffmpeg
+from .shape import (
+    Shape,
+    add_circle,
+    add_ellipse,
+    add_line,
+    add_quad,
+    add_rect,
+    add_triangle,
+)
+from .framesink import FrameSink
+from .images import LazyImage, decode_image
 
 
 DEFAULT_WIDTH = 600
@@ -62,6 +74,13 @@ class Canvas:
         self.total_recorded_frames = 0
         self.max_frames = 0
 
+        self.is_sharing = False
+        self.total_shared_frames = 0
+        self.max_shared_frames = 0
+
+        self.image_loader = None
+        self.image_loader_workers = None
+
         if renderer == "GPU":
             self.setup_gl()
         elif renderer == "CPU":
@@ -273,8 +292,7 @@ class Canvas:
             x2 (float): x2
             y2 (float): y2
         """
-        self.path.moveTo(x1, y1)
-        self.path.lineTo(x2, y2)
+        add_line(self.path, x1, y1, x2, y2)
         self.render()
 
     def ellipse(self, x: float, y: float, w: float, h: float):
@@ -285,22 +303,7 @@ class Canvas:
             w (float): width
             h (float): height
         """
-        # TODO: Switch to built in oval method
-
-        kappa = 0.5522847498
-        ox = w / 2 * kappa
-        oy = h / 2 * kappa
-        xe = x + w
-        ye = y + h
-        xm = x + w / 2
-        ym = y + h / 2
-
-        self.path.moveTo(x, ym)
-        self.path.cubicTo(x, ym - oy, xm - ox, y, xm, y)
-        self.path.cubicTo(xm + ox, y, xe, ym - oy, xe, ym)
-        self.path.cubicTo(xe, ym + oy, xm + ox, ye, xm, ye)
-        self.path.cubicTo(xm - ox, ye, x, ym + oy, x, ym)
-
+        add_ellipse(self.path, x, y, w, h)
         self.render()
 
     def circle(self, x: float, y: float, d: float):
@@ -310,7 +313,7 @@ class Canvas:
             y (float): y
             d (float): diameter
         """
-        self.path.addCircle(x, y, d / 2)
+        add_circle(self.path, x, y, d)
         self.render()
 
     def quad(
@@ -335,11 +338,7 @@ class Canvas:
             x4 (float): x4
             y4 (float): y4
         """
-        self.path.moveTo(x1, y1)
-        self.path.lineTo(x2, y2)
-        self.path.lineTo(x3, y3)
-        self.path.lineTo(x4, y4)
-        self.path.close()
+        add_quad(self.path, x1, y1, x2, y2, x3, y3, x4, y4)
         self.render()
 
     def rect(
@@ -365,52 +364,7 @@ class Canvas:
             bl (float): bottom left corner radius
         """
 
-        # TODO: make it more "skia-ish" and have sep func for rounded rect?
-
-        if tl is None:
-            self.path.moveTo(x, y)
-            self.path.lineTo(x + w, y)
-            self.path.lineTo(x + w, y + h)
-            self.path.lineTo(x, y + h)
-            self.path.close()
-            self.render()
-            return
-
-        if tr is None:
-            tr = tl
-        if br is None:
-            br = tr
-        if bl is None:
-            bl = br
-
-        absW = abs(w)
-        absH = abs(h)
-        hw = absW / 2
-        hh = absH / 2
-        if absW < 2 * tl:
-            tl = hw
-        if absH < 2 * tl:
-            tl = hh
-        if absW < 2 * tr:
-            tr = hw
-        if absH < 2 * tr:
-            tr = hh
-        if absW < 2 * br:
-            br = hw
-        if absH < 2 * br:
-            br = hh
-        if absW < 2 * bl:
-            bl = hw
-        if absH < 2 * bl:
-            bl = hh
-
-        self.path.moveTo(x + tl, y)
-        self.path.arcTo(x + w, y, x + w, y + h, tr)
-        self.path.arcTo(x + w, y + h, x, y + h, br)
-        self.path.arcTo(x, y + h, x, y, bl)
-        self.path.arcTo(x, y, x + w, y, tl)
-        self.path.close()
-
+        add_rect(self.path, x, y, w, h, tl, tr, br, bl)
         self.render()
 
     def triangle(
@@ -425,11 +379,7 @@ class Canvas:
             x3 (float): x3
             y3 (float): y3
         """
-        self.path.moveTo(x1, y1)
-        self.path.lineTo(x2, y2)
-        self.path.lineTo(x3, y3)
-        self.path.close()
-
+        add_triangle(self.path, x1, y1, x2, y2, x3, y3)
         self.render()
 
     def arc(self):
@@ -440,9 +390,40 @@ class Canvas:
         # TODO: implement with addPoly
         raise NotImplementedError
 
-    def create_path(self):
-        # TODO: implement
-        raise NotImplementedError
+    def create_path(self) -> Shape:
+        """Create a reusable shape. Build it once and draw it with `shape()`"""
+        return Shape()
+
+    def shape(
+        self,
+        shape: Shape,
+        x: float = 0,
+        y: float = 0,
+        deg: float = 0,
+        sx: float = 1,
+        sy: Optional[float] = None,
+    ):
+        """Draw a shape created with `create_path()` with the current fill and stroke
+        Args:
+            shape (Shape): shape to draw
+            x (float): x translation
+            y (float): y translation
+            deg (float): degrees to rotate
+            sx (float): x scale
+            sy (float): y scale (default: same as sx)
+        """
+        if sy is None:
+            sy = sx
+
+        self.canvas.save()
+        self.canvas.translate(x, y)
+        if deg:
+            self.canvas.rotate(deg)
+        if sx != 1 or sy != 1:
+            self.canvas.scale(sx, sy)
+
+        self.draw_path(shape.path)
+        self.canvas.restore()
 
     def text(self, text: str, x: float, y: float):
         """Draw text
@@ -491,9 +472,50 @@ class Canvas:
         """
         return skia.Image.open(path)
 
+    def load_images(
+        self,
+        paths: list[str],
+        workers: Optional[int] = None,
+        w: Optional[float] = None,
+        h: Optional[float] = None,
+        lazy: bool = False,
+        futures: bool = False,
+    ) -> list[skia.Image] | list[LazyImage] | list[Future]:
+        """Load many images, decoding them in parallel on a thread pool
+
+        skia releases the GIL while decoding, so the threads decode in parallel. The pool
+        is kept and reused by later calls with the same number of workers.
+
+        If w and/or h are given, images are decoded to that size (see `image()`).
+
+        Args:
+            paths (list[str]): paths to image files
+            workers (Optional[int]): number of decoding threads (default: ThreadPoolExecutor's default)
+            w (Optional[float]): width to decode to
+            h (Optional[float]): height to decode to
+            lazy (bool): don't decode now, decode each image the first time it is drawn with `image()`
+            futures (bool): return futures right away instead of waiting for the images (can't be used with lazy)
+        """
+        if lazy:
+            if futures:
+                raise Exception("load_images can't return futures for lazy images")
+            return [LazyImage(path, w, h) for path in paths]
+
+        if self.image_loader is None or self.image_loader_workers != workers:
+            if self.image_loader is not None:
+                self.image_loader.shutdown(wait=False)
+            self.image_loader = ThreadPoolExecutor(max_workers=workers)
+            self.image_loader_workers = workers
+
+        pending = [self.image_loader.submit(decode_image, path, w, h) for path in paths]
+
+        if futures:
+            return pending
+        return [f.result() for f in pending]
+
     def image(
         self,
-        image: skia.Image,
+        image: skia.Image | LazyImage,
         x: float,
         y: float,
         w: Optional[float] = None,
@@ -504,13 +526,16 @@ class Canvas:
         If w and h are None, the image will be drawn at its original size. If only w or only h is None, the image will be drawn based on the given dimension, maintaining its aspect ratio.
 
         Args:
-            image (skia.Image): image to draw
+            image (skia.Image|LazyImage): image to draw
             x (float): x
             y (float): y
             w (Optional[float]): width
             h (Optional[float]): height
         """
 
+        if isinstance(image, LazyImage):
+            image = image.get()
+
         if w is None and h is None:
             w = image.width()
             h = image.height()
@@ -540,6 +565,16 @@ class Canvas:
                 self.finish_video()
                 return False
 
+        if self.is_sharing:
+            if (
+                self.max_shared_frames == 0
+                or self.total_shared_frames < self.max_shared_frames
+            ):
+                self.share_frame()
+            else:
+                self.finish_sharing()
+                return False
+
         if self.renderer == "GPU" and self.show:
             now = glfw.get_time()
             if now - self.last_frame_time < self._fps:
@@ -557,6 +592,10 @@ class Canvas:
             if glfw.get_key(
                 self.window, glfw.KEY_ESCAPE
             ) == glfw.PRESS or glfw.window_should_close(self.window):
+                if self.is_recording:
+                    self.finish_video()
+                if self.is_sharing:
+                    self.finish_sharing()
                 glfw.terminate()
                 self.context.abandonContext()
                 return False
@@ -580,10 +619,20 @@ class Canvas:
 
     def render(self, rewind=True):
         """Render the shape/image/text etc to the canvas"""
+        self.draw_path(self.path)
+
+        if rewind:
+            self.path.rewind()
+
+    def draw_path(self, path: Path):
+        """Draw a skia Path with the current fill and stroke
+        Args:
+            path (skia.Path): path to draw
+        """
         if self._fill:
             self.paint.setStyle(Paint.kFill_Style)
             self.paint.setColor(Color4f(*self._fill))
-            self.canvas.drawPath(self.path, self.paint)
+            self.canvas.drawPath(path, self.paint)
 
         if self._stroke_weight and self._stroke_weight > 0:
             # self.paint.setStrokeCap(self.style.stroke_cap)
@@ -591,10 +640,7 @@ class Canvas:
             self.paint.setStyle(Paint.kStroke_Style)
             self.paint.setColor(Color4f(*self._stroke))
             self.paint.setStrokeWidth(self._stroke_weight)
-            self.canvas.drawPath(self.path, self.paint)
-
-        if rewind:
-            self.path.rewind()
+            self.canvas.drawPath(path, self.paint)
 
     def push(self):
         """Push the canvas state"""
@@ -715,3 +761,41 @@ class Canvas:
         print("stopping recording")
         self.is_recording = False
         self.writer.close()
+
+    def share_frames(
+        self,
+        name: Optional[str] = None,
+        path: Optional[str] = None,
+        slots: int = 4,
+        frames: int = 0,
+    ) -> FrameSink:
+        """Share frames with other processes through a shared memory ring buffer.
+        Read them with `easyskia.FrameReader`
+        Args:
+            name (Optional[str]): shared memory name (generated if None)
+            path (Optional[str]): memory-mapped file to write to instead of shared memory
+            slots (int): number of frames kept in the ring buffer
+            frames (int): maximum number of frames to share
+        """
+        if self.is_sharing:
+            self.finish_sharing()
+
+        self.total_shared_frames = 0
+        self.is_sharing = True
+        self.max_shared_frames = frames
+        self.frame_sink = FrameSink(
+            self.width, self.height, slots=slots, name=name, path=path
+        )
+        print(f"sharing frames at {self.frame_sink.name}")
+        return self.frame_sink
+
+    def share_frame(self):
+        """Share a frame"""
+        self.total_shared_frames += 1
+        self.frame_sink.write(self.canvas)
+
+    def finish_sharing(self):
+        """Stop sharing frames"""
+        print("stopping sharing")
+        self.is_sharing = False
+        self.frame_sink.close()
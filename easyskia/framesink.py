@@ -0,0 +1,256 @@
+from typing import Optional, Iterator
+import mmap
+import os
+import struct
+import time
+from multiprocessing import resource_tracker, shared_memory
+import numpy as np
+import skia
+
+# Buffer layout:
+#
+#   header | slot 0 | slot 1 | ... | slot n-1
+#
+# header: magic, width, height, slot count, latest frame index (-1 if none)
+# slot:   frame index, width, height, timestamp, then width * height RGBA pixels
+#
+# Frames are written round robin, so frame i lives in slot i % slots. Before its
+# pixels are overwritten a slot's frame index is set to -1, and the new index is
+# only published once the pixels are written, so a reader that checks the slot
+# index again after using a frame knows whether it was overwritten meanwhile.
+
+MAGIC = b"ESKF"
+HEADER = struct.Struct("<4sIIIq")
+SLOT_HEADER = struct.Struct("<qIId")
+HEADER_SIZE = 64
+SLOT_HEADER_SIZE = 64
+
+# shared memory created by a FrameSink in this process
+_owned = set()
+
+
+def _slot_size(width: int, height: int) -> int:
+    return SLOT_HEADER_SIZE + width * height * 4
+
+
+def _open_shared_memory(name: str) -> shared_memory.SharedMemory:
+    # don't let the resource tracker unlink memory owned by another process when
+    # this one exits
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore
+    except TypeError:
+        pass
+
+    shm = shared_memory.SharedMemory(name=name)
+    if os.name == "posix" and name not in _owned:
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore
+    return shm
+
+
+class FrameSink:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        slots: int = 4,
+        name: Optional[str] = None,
+        path: Optional[str] = None,
+    ):
+        """Create a ring buffer of RGBA frames that other processes can read with `FrameReader`
+        Args:
+            width (int): frame width
+            height (int): frame height
+            slots (int): number of frames kept in the ring buffer
+            name (Optional[str]): shared memory name (generated if None)
+            path (Optional[str]): memory-mapped file to write to instead of shared memory
+        """
+        self.width = width
+        self.height = height
+        self.slots = slots
+        self.path = path
+        self.frame_index = -1
+
+        size = HEADER_SIZE + slots * _slot_size(width, height)
+        self.shm = None
+        self.mmap = None
+        if path is not None:
+            with open(path, "w+b") as f:
+                f.truncate(size)
+                self.mmap = mmap.mmap(f.fileno(), size)
+            self.buf = memoryview(self.mmap)
+            self.name = path
+        else:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self.buf = self.shm.buf
+            self.name = self.shm.name
+            _owned.add(self.name)
+
+        HEADER.pack_into(self.buf, 0, MAGIC, width, height, slots, -1)
+        self.info = skia.ImageInfo.Make(
+            width, height, skia.kRGBA_8888_ColorType, skia.kUnpremul_AlphaType
+        )
+
+    def write(self, canvas: skia.Canvas) -> bool:
+        """Read the canvas pixels straight into the next slot
+        Args:
+            canvas (skia.Canvas): canvas to read from
+        """
+        index = self.frame_index + 1
+        offset = HEADER_SIZE + (index % self.slots) * _slot_size(self.width, self.height)
+        start = offset + SLOT_HEADER_SIZE
+        pixels = self.buf[start : start + self.width * self.height * 4]
+        SLOT_HEADER.pack_into(self.buf, offset, -1, self.width, self.height, 0)
+        if not canvas.readPixels(self.info, pixels, self.width * 4):
+            return False
+
+        SLOT_HEADER.pack_into(
+            self.buf, offset, index, self.width, self.height, time.time()
+        )
+        HEADER.pack_into(
+            self.buf, 0, MAGIC, self.width, self.height, self.slots, index
+        )
+        self.frame_index = index
+        return True
+
+    def close(self):
+        """Close the sink. Shared memory is unlinked, memory-mapped files are kept"""
+        if self.mmap is not None:
+            self.buf.release()
+            self.mmap.close()
+        if self.shm is not None:
+            self.shm.close()
+            _owned.discard(self.name)
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                # already unlinked by someone else, stop tracking it
+                if os.name == "posix":
+                    resource_tracker.unregister(self.shm._name, "shared_memory")  # type: ignore
+
+
+class FrameReader:
+    def __init__(self, name: Optional[str] = None, path: Optional[str] = None):
+        """Read frames written by a `FrameSink` in another process
+
+        Frames are returned as numpy arrays of shape (height, width, 4) that point
+        directly into the shared buffer, so they are overwritten once the sink
+        wraps around the ring. Check `valid()` after using a frame to make sure it
+        wasn't overwritten meanwhile, or read with copy=True to get a copy that
+        has already been checked. All arrays must be released before calling
+        `close()`.
+
+        Args:
+            name (Optional[str]): shared memory name
+            path (Optional[str]): memory-mapped file to read from
+        """
+        self.shm = None
+        self.mmap = None
+        if path is not None:
+            with open(path, "rb") as f:
+                self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.buf = memoryview(self.mmap)
+        elif name is not None:
+            self.shm = _open_shared_memory(name)
+            self.buf = self.shm.buf
+        else:
+            raise Exception("FrameReader requires a shared memory name or a path")
+
+        magic, self.width, self.height, self.slots, _ = HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC:
+            raise Exception("Not an easyskia frame buffer")
+
+    def latest_index(self) -> int:
+        """Get the index of the most recently written frame (-1 if none)"""
+        return HEADER.unpack_from(self.buf, 0)[4]
+
+    def _slot_offset(self, index: int) -> int:
+        return HEADER_SIZE + (index % self.slots) * _slot_size(self.width, self.height)
+
+    def valid(self, index: int) -> bool:
+        """Check that a frame is still in the buffer and isn't being overwritten
+        Args:
+            index (int): frame index
+        """
+        if index < 0:
+            return False
+        return SLOT_HEADER.unpack_from(self.buf, self._slot_offset(index))[0] == index
+
+    def read(
+        self, index: int, copy: bool = False
+    ) -> Optional[tuple[float, np.ndarray]]:
+        """Read a frame
+        Args:
+            index (int): frame index
+            copy (bool): copy the pixels out of the shared buffer
+
+        Returns the frame's timestamp and pixels, or None if the frame hasn't been
+        written yet or has already been overwritten. Without copy, the pixels are
+        only intact as long as `valid(index)` is True.
+        """
+        if index < 0:
+            return None
+
+        offset = self._slot_offset(index)
+        slot_index, width, height, timestamp = SLOT_HEADER.unpack_from(self.buf, offset)
+        if slot_index != index:
+            return None
+
+        start = offset + SLOT_HEADER_SIZE
+        pixels = np.frombuffer(
+            self.buf, dtype=np.uint8, count=width * height * 4, offset=start
+        ).reshape(height, width, 4)
+
+        if copy:
+            pixels = pixels.copy()
+            if not self.valid(index):
+                return None
+
+        return timestamp, pixels
+
+    def latest(self, copy: bool = False) -> Optional[tuple[int, float, np.ndarray]]:
+        """Read the most recently written frame
+        Args:
+            copy (bool): copy the pixels out of the shared buffer
+
+        Returns the frame's index, timestamp and pixels, or None if no frame has
+        been written yet.
+        """
+        index = self.latest_index()
+        frame = self.read(index, copy=copy)
+        if frame is None:
+            return None
+        return index, *frame
+
+    def frames(
+        self,
+        poll: float = 0.001,
+        timeout: Optional[float] = None,
+        copy: bool = False,
+    ) -> Iterator[tuple[int, float, np.ndarray]]:
+        """Iterate over frames as they are written, skipping any that were missed
+        Args:
+            poll (float): seconds to wait between checks for a new frame
+            timeout (Optional[float]): stop after this many seconds without a new frame
+            copy (bool): copy the pixels out of the shared buffer
+        """
+        last = -1
+        last_frame_time = time.monotonic()
+        while True:
+            frame = self.latest(copy=copy)
+            if frame is not None and frame[0] != last:
+                last = frame[0]
+                yield frame
+                last_frame_time = time.monotonic()
+                continue
+
+            if timeout is not None and time.monotonic() - last_frame_time >= timeout:
+                return
+            time.sleep(poll)
+
+    def close(self):
+        """Close the reader"""
+        if self.mmap is not None:
+            self.buf.release()
+            self.mmap.close()
+        if self.shm is not None:
+            self.shm.close()
@@ -0,0 +1,84 @@
+from typing import Optional
+import numpy as np
+import skia
+
+
+def decode_image(
+    path: str, w: Optional[float] = None, h: Optional[float] = None
+) -> skia.Image:
+    """Load and fully decode an image, optionally to a given size
+
+    If only w or only h is given, the other dimension is based on the image's aspect ratio.
+    Formats that support scaled decoding (like JPEG and WebP) are decoded at the
+    closest size the codec supports, so the full size image is never decoded.
+    Anything left over, and other formats like PNG, are resized after decoding.
+
+    Args:
+        path (str): path to image file
+        w (Optional[float]): width to decode to
+        h (Optional[float]): height to decode to
+    """
+    # the codec doesn't keep its data alive, so hold on to it while decoding
+    data = skia.Data.MakeFromFileName(path)
+    codec = skia.Codec.MakeFromData(data)
+    if codec is None:
+        raise Exception(f"Can't decode image: {path}")
+
+    size = codec.dimensions()
+    if w is None and h is None:
+        w = size.width()
+        h = size.height()
+    elif w is None and h is not None:
+        w = size.width() * (h / size.height())
+    elif h is None and w is not None:
+        h = size.height() * (w / size.width())
+
+    w = round(w)  # type: ignore
+    h = round(h)  # type: ignore
+    scale = max(w / size.width(), h / size.height())
+    if scale < 1:
+        size = codec.getScaledDimensions(scale)
+
+    info = skia.ImageInfo.Make(
+        size.width(), size.height(), skia.kRGBA_8888_ColorType, skia.kPremul_AlphaType
+    )
+    pixels = np.empty((size.height(), size.width(), 4), dtype=np.uint8)
+    result = codec.getPixels(info, pixels, info.minRowBytes())
+    if result != skia.Codec.Result.kSuccess:
+        message = skia.Codec.ResultToString(result)
+        raise Exception(f"Can't decode image: {path} ({message})")
+
+    image = skia.Image.fromarray(
+        pixels, colorType=skia.kRGBA_8888_ColorType, alphaType=skia.kPremul_AlphaType
+    )
+    if (image.width(), image.height()) != (w, h):
+        image = image.resize(w, h)
+    return image
+
+
+class LazyImage:
+    def __init__(
+        self, path: str, w: Optional[float] = None, h: Optional[float] = None
+    ):
+        """An image that is decoded the first time it is drawn
+        Args:
+            path (str): path to image file
+            w (Optional[float]): width to decode to
+            h (Optional[float]): height to decode to
+        """
+        self.path = path
+        self.w = w
+        self.h = h
+        self._image = None
+
+    def get(self) -> skia.Image:
+        """Get the decoded image, decoding it if needed"""
+        if self._image is None:
+            self._image = decode_image(self.path, self.w, self.h)
+        return self._image
+
+    def width(self) -> int:
+        return self.get().width()
+
+    def height(self) -> int:
+        return self.get().height()
@@ -0,0 +1,328 @@
+from typing import Optional
+import skia
+from skia import Path
+
+
+def add_line(path: Path, x1: float, y1: float, x2: float, y2: float):
+    """Add a line to a path
+    Args:
+        path (skia.Path): path to add to
+        x1 (float): x1
+        y1 (float): y1
+        x2 (float): x2
+        y2 (float): y2
+    """
+    path.moveTo(x1, y1)
+    path.lineTo(x2, y2)
+
+
+def add_ellipse(path: Path, x: float, y: float, w: float, h: float):
+    """Add an ellipse to a path
+    Args:
+        path (skia.Path): path to add to
+        x (float): x
+        y (float): y
+        w (float): width
+        h (float): height
+    """
+    path.addOval(skia.Rect.MakeXYWH(x, y, w, h))
+
+
+def add_circle(path: Path, x: float, y: float, d: float):
+    """Add a circle to a path
+    Args:
+        path (skia.Path): path to add to
+        x (float): x
+        y (float): y
+        d (float): diameter
+    """
+    path.addCircle(x, y, d / 2)
+
+
+def add_quad(
+    path: Path,
+    x1: float,
+    y1: float,
+    x2: float,
+    y2: float,
+    x3: float,
+    y3: float,
+    x4: float,
+    y4: float,
+):
+    """Add a quad to a path
+    Args:
+        path (skia.Path): path to add to
+        x1 (float): x1
+        y1 (float): y1
+        x2 (float): x2
+        y2 (float): y2
+        x3 (float): x3
+        y3 (float): y3
+        x4 (float): x4
+        y4 (float): y4
+    """
+    path.moveTo(x1, y1)
+    path.lineTo(x2, y2)
+    path.lineTo(x3, y3)
+    path.lineTo(x4, y4)
+    path.close()
+
+
+def add_rect(
+    path: Path,
+    x: float,
+    y: float,
+    w: float,
+    h: float,
+    tl: Optional[float] = None,
+    tr: Optional[float] = None,
+    br: Optional[float] = None,
+    bl: Optional[float] = None,
+):
+    """Add a rectangle, optionally with rounded corners, to a path
+    Args:
+        path (skia.Path): path to add to
+        x (float): x
+        y (float): y
+        w (float): width
+        h (float): height
+        tl (float): top left corner radius
+        tr (float): top right corner radius
+        br (float): bottom right corner radius
+        bl (float): bottom left corner radius
+    """
+    if tl is None:
+        path.moveTo(x, y)
+        path.lineTo(x + w, y)
+        path.lineTo(x + w, y + h)
+        path.lineTo(x, y + h)
+        path.close()
+        return
+
+    if tr is None:
+        tr = tl
+    if br is None:
+        br = tr
+    if bl is None:
+        bl = br
+
+    absW = abs(w)
+    absH = abs(h)
+    hw = absW / 2
+    hh = absH / 2
+    if absW < 2 * tl:
+        tl = hw
+    if absH < 2 * tl:
+        tl = hh
+    if absW < 2 * tr:
+        tr = hw
+    if absH < 2 * tr:
+        tr = hh
+    if absW < 2 * br:
+        br = hw
+    if absH < 2 * br:
+        br = hh
+    if absW < 2 * bl:
+        bl = hw
+    if absH < 2 * bl:
+        bl = hh
+
+    path.moveTo(x + tl, y)
+    path.arcTo(x + w, y, x + w, y + h, tr)
+    path.arcTo(x + w, y + h, x, y + h, br)
+    path.arcTo(x, y + h, x, y, bl)
+    path.arcTo(x, y, x + w, y, tl)
+    path.close()
+
+
+def add_triangle(
+    path: Path, x1: float, y1: float, x2: float, y2: float, x3: float, y3: float
+):
+    """Add a triangle to a path
+    Args:
+        path (skia.Path): path to add to
+        x1 (float): x1
+        y1 (float): y1
+        x2 (float): x2
+        y2 (float): y2
+        x3 (float): x3
+        y3 (float): y3
+    """
+    path.moveTo(x1, y1)
+    path.lineTo(x2, y2)
+    path.lineTo(x3, y3)
+    path.close()
+
+
+class Shape:
+    """A reusable shape
+
+    The geometry is built once and can then be drawn any number of times with
+    `Canvas.shape()`, under different transforms and with the current fill and
+    stroke. Because the same skia Path is reused for every draw, skia can cache
+    its rasterized mask between draws.
+
+    Example:
+        arrow = c.create_path().triangle(-10, -10, 10, 0, -10, 10)
+        for i in range(12):
+            c.shape(arrow, 300, 300, deg=i * 30)
+    """
+
+    def __init__(self):
+        self._path = Path()
+
+    @property
+    def path(self) -> Path:
+        """The shape's skia Path"""
+        return self._path
+
+    def bounds(self) -> skia.Rect:
+        """Get the bounds of the shape"""
+        return self._path.computeTightBounds()
+
+    def move_to(self, x: float, y: float):
+        """Start a new contour
+        Args:
+            x (float): x
+            y (float): y
+        """
+        self._path.moveTo(x, y)
+        return self
+
+    def line_to(self, x: float, y: float):
+        """Add a line to the current contour
+        Args:
+            x (float): x
+            y (float): y
+        """
+        self._path.lineTo(x, y)
+        return self
+
+    def quad_to(self, cx: float, cy: float, x: float, y: float):
+        """Add a quadratic bezier curve to the current contour
+        Args:
+            cx (float): control point x
+            cy (float): control point y
+            x (float): x
+            y (float): y
+        """
+        self._path.quadTo(cx, cy, x, y)
+        return self
+
+    def cubic_to(
+        self, cx1: float, cy1: float, cx2: float, cy2: float, x: float, y: float
+    ):
+        """Add a cubic bezier curve to the current contour
+        Args:
+            cx1 (float): first control point x
+            cy1 (float): first control point y
+            cx2 (float): second control point x
+            cy2 (float): second control point y
+            x (float): x
+            y (float): y
+        """
+        self._path.cubicTo(cx1, cy1, cx2, cy2, x, y)
+        return self
+
+    def close(self):
+        """Close the current contour"""
+        self._path.close()
+        return self
+
+    def line(self, x1: float, y1: float, x2: float, y2: float):
+        """Add a line
+        Args:
+            x1 (float): x1
+            y1 (float): y1
+            x2 (float): x2
+            y2 (float): y2
+        """
+        add_line(self._path, x1, y1, x2, y2)
+        return self
+
+    def ellipse(self, x: float, y: float, w: float, h: float):
+        """Add an ellipse
+        Args:
+            x (float): x
+            y (float): y
+            w (float): width
+            h (float): height
+        """
+        add_ellipse(self._path, x, y, w, h)
+        return self
+
+    def circle(self, x: float, y: float, d: float):
+        """Add a circle
+        Args:
+            x (float): x
+            y (float): y
+            d (float): diameter
+        """
+        add_circle(self._path, x, y, d)
+        return self
+
+    def rect(
+        self,
+        x: float,
+        y: float,
+        w: float,
+        h: float,
+        tl: Optional[float] = None,
+        tr: Optional[float] = None,
+        br: Optional[float] = None,
+        bl: Optional[float] = None,
+    ):
+        """Add a rectangle
+        Args:
+            x (float): x
+            y (float): y
+            w (float): width
+            h (float): height
+            tl (float): top left corner radius
+            tr (float): top right corner radius
+            br (float): bottom right corner radius
+            bl (float): bottom left corner radius
+        """
+        add_rect(self._path, x, y, w, h, tl, tr, br, bl)
+        return self
+
+    def triangle(
+        self, x1: float, y1: float, x2: float, y2: float, x3: float, y3: float
+    ):
+        """Add a triangle
+        Args:
+            x1 (float): x1
+            y1 (float): y1
+            x2 (float): x2
+            y2 (float): y2
+            x3 (float): x3
+            y3 (float): y3
+        """
+        add_triangle(self._path, x1, y1, x2, y2, x3, y3)
+        return self
+
+    def quad(
+        self,
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float,
+        x3: float,
+        y3: float,
+        x4: float,
+        y4: float,
+    ):
+        """Add a quad
+        Args:
+            x1 (float): x1
+            y1 (float): y1
+            x2 (float): x2
+            y2 (float): y2
+            x3 (float): x3
+            y3 (float): y3
+            x4 (float): x4
+            y4 (float): y4
+        """
+        add_quad(self._path, x1, y1, x2, y2, x3, y3, x4, y4)
+        return self
@@ -1 +1 @@
-poetry run pydoc-markdown -I . -m easyskia.canvas --render-toc
+poetry run pydoc-markdown -I . -m easyskia.canvas -m easyskia.shape -m easyskia.framesink -m easyskia.images --render-toc
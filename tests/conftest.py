@@ -0,0 +1,7 @@
+import pytest
+from easyskia import Canvas
+
+
+@pytest.fixture
+def canvas() -> Canvas:
+    return Canvas(width=100, height=100, renderer="CPU")
@@ -0,0 +1,153 @@
+import os
+import subprocess
+import sys
+import time
+import pytest
+from easyskia import FrameSink, FrameReader
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+READER_SCRIPT = """
+import sys
+import time
+from easyskia import FrameReader
+reader = FrameReader(name=sys.argv[1])
+print(reader.latest_index())
+reader.close()
+"""
+
+
+def run_reader(name: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    return subprocess.run(
+        [sys.executable, "-c", READER_SCRIPT, name],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_reader_process_exit_keeps_shared_memory(canvas):
+    sink = FrameSink(canvas.width, canvas.height)
+    sink.write(canvas.canvas)
+
+    first = run_reader(sink.name)
+    assert first.returncode == 0, first.stderr
+    assert first.stdout.strip() == "0"
+    assert "leaked" not in first.stderr
+
+    second = run_reader(sink.name)
+    assert second.returncode == 0, second.stderr
+    assert second.stdout.strip() == "0"
+
+    sink.close()
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="needs /dev/shm")
+def test_sink_close_tolerates_unlinked_memory():
+    sink = FrameSink(100, 100)
+    os.unlink("/dev/shm/" + sink.name)
+    sink.close()
+
+
+@pytest.fixture(params=["shm", "mmap"])
+def sink_and_reader(request, tmp_path, canvas):
+    canvas.background(1, 0, 0)
+    if request.param == "mmap":
+        sink = FrameSink(
+            canvas.width, canvas.height, slots=2, path=str(tmp_path / "frames.bin")
+        )
+        reader = FrameReader(path=sink.name)
+    else:
+        sink = FrameSink(canvas.width, canvas.height, slots=2)
+        reader = FrameReader(name=sink.name)
+    yield sink, reader
+    reader.close()
+    sink.close()
+
+
+def test_round_trip(sink_and_reader, canvas):
+    sink, reader = sink_and_reader
+    assert reader.latest() is None
+
+    sink.write(canvas.canvas)
+
+    index, timestamp, pixels = reader.latest(copy=True)
+    assert index == 0
+    assert timestamp > 0
+    assert pixels.shape == (100, 100, 4)
+    assert (pixels == [255, 0, 0, 255]).all()
+
+
+def test_ring_wraps_around(sink_and_reader, canvas):
+    sink, reader = sink_and_reader
+    for _ in range(3):
+        sink.write(canvas.canvas)
+
+    assert reader.read(0) is None
+    assert reader.read(1) is not None
+    assert reader.read(2) is not None
+    assert reader.read(3) is None
+
+
+def test_overwritten_frames_are_detected(sink_and_reader, canvas):
+    sink, reader = sink_and_reader
+    sink.write(canvas.canvas)
+    sink.write(canvas.canvas)
+
+    _, pixels = reader.read(0)
+    assert reader.valid(0)
+
+    seen_during_write = []
+
+    class CheckingCanvas:
+        def readPixels(self, *args):
+            seen_during_write.append(
+                (reader.valid(0), reader.read(0), reader.read(0, copy=True))
+            )
+            return canvas.canvas.readPixels(*args)
+
+    sink.write(CheckingCanvas())
+    assert seen_during_write == [(False, None, None)]
+    assert not reader.valid(0)
+    assert reader.read(2, copy=True) is not None
+    del pixels
+
+
+def test_animate_stops_after_shared_frames(canvas):
+    sink = canvas.share_frames(frames=3)
+    reader = FrameReader(name=sink.name)
+
+    loops = 0
+    while canvas.animate():
+        assert reader.latest_index() == loops
+        loops += 1
+
+    assert loops == 3
+    assert not canvas.is_sharing
+    reader.close()
+
+
+def test_frames_timeout_uses_wall_clock(sink_and_reader, monkeypatch):
+    _, reader = sink_and_reader
+
+    def slow_latest(copy=False):
+        time.sleep(0.05)
+        return None
+
+    monkeypatch.setattr(reader, "latest", slow_latest)
+    start = time.monotonic()
+    assert list(reader.frames(poll=0.001, timeout=0.1)) == []
+    assert time.monotonic() - start < 0.5
+
+
+def test_share_frames_again_closes_previous_sink(canvas):
+    first = canvas.share_frames()
+    second = canvas.share_frames()
+
+    assert first.shm.buf is None
+    with pytest.raises(FileNotFoundError):
+        FrameReader(name=first.name)
+
+    canvas.finish_sharing()
+    assert second.shm.buf is None
@@ -0,0 +1,136 @@
+import os
+import threading
+import time
+import numpy as np
+import pytest
+import skia
+from easyskia import LazyImage
+from easyskia.images import decode_image
+
+
+def write_images(
+    tmp_path, count: int, width: int, height: int, encoding=skia.kPNG
+) -> tuple[list[str], list[np.ndarray]]:
+    rng = np.random.default_rng(0)
+    ext = "png" if encoding == skia.kPNG else "jpg"
+    paths = []
+    sources = []
+    for i in range(count):
+        pixels = rng.integers(0, 256, (height, width, 4), dtype=np.uint8)
+        pixels[:, :, 3] = 255
+        path = str(tmp_path / f"image_{i}.{ext}")
+        skia.Image.fromarray(pixels).save(path, encoding)
+        paths.append(path)
+        sources.append(pixels)
+    return paths, sources
+
+
+def drawn(canvas, image) -> np.ndarray:
+    canvas.clear()
+    canvas.image(image, 0, 0)
+    return canvas.canvas.toarray(colorType=skia.kRGBA_8888_ColorType)
+
+
+def test_load_images_keeps_order_and_colors(canvas, tmp_path):
+    paths, sources = write_images(tmp_path, 3, 20, 10)
+    images = canvas.load_images(paths, workers=2)
+
+    for source, image in zip(sources, images):
+        assert (drawn(canvas, image)[:10, :20] == source).all()
+
+
+def test_eager_lazy_and_single_loads_draw_the_same(canvas, tmp_path):
+    paths, _ = write_images(tmp_path, 2, 20, 10)
+    eager = canvas.load_images(paths)
+    lazy = canvas.load_images(paths, lazy=True)
+    futures = canvas.load_images(paths, futures=True)
+
+    for i, path in enumerate(paths):
+        expected = drawn(canvas, canvas.load_image(path))
+        assert (drawn(canvas, eager[i]) == expected).all()
+        assert (drawn(canvas, lazy[i]) == expected).all()
+        assert (drawn(canvas, futures[i].result()) == expected).all()
+
+
+def test_load_images_decodes_to_size(canvas, tmp_path):
+    paths, _ = write_images(tmp_path, 2, 20, 10)
+
+    images = canvas.load_images(paths, w=10)
+    assert [(i.width(), i.height()) for i in images] == [(10, 5), (10, 5)]
+
+    images = canvas.load_images(paths, w=8, h=8)
+    assert [(i.width(), i.height()) for i in images] == [(8, 8), (8, 8)]
+
+
+def test_jpeg_decodes_at_reduced_scale(tmp_path):
+    paths, _ = write_images(tmp_path, 1, 800, 800, encoding=skia.kJPEG)
+    data = skia.Data.MakeFromFileName(paths[0])
+    codec = skia.Codec.MakeFromData(data)
+    assert codec.getScaledDimensions(0.25) == skia.ISize(200, 200)
+
+    image = decode_image(paths[0], w=200)
+    assert (image.width(), image.height()) == (200, 200)
+
+
+def test_load_images_lazy(canvas, tmp_path):
+    paths, _ = write_images(tmp_path, 2, 20, 10)
+    images = canvas.load_images(paths, lazy=True, h=5)
+    assert all(isinstance(i, LazyImage) for i in images)
+    assert images[0]._image is None
+
+    canvas.image(images[0], 0, 0)
+    assert images[0]._image is not None
+    assert images[0].width() == 10
+    assert images[1]._image is None
+
+    with pytest.raises(Exception):
+        canvas.load_images(paths, lazy=True, futures=True)
+
+
+def test_load_images_reuses_thread_pool(canvas, tmp_path):
+    paths, _ = write_images(tmp_path, 1, 20, 10)
+    canvas.load_images(paths, workers=2)
+    loader = canvas.image_loader
+    canvas.load_images(paths, workers=2)
+    assert canvas.image_loader is loader
+
+
+def test_decoding_releases_the_gil(canvas, tmp_path):
+    # threads only decode in parallel if skia releases the GIL, which shows up
+    # as the main thread still running while a decode is in progress
+    paths, _ = write_images(tmp_path, 1, 2000, 2000)
+
+    start = time.perf_counter()
+    decode_image(paths[0])
+    decode_time = time.perf_counter() - start
+
+    done = threading.Event()
+    future = canvas.load_images(paths, futures=True)[0]
+    future.add_done_callback(lambda f: done.set())
+
+    longest_stall = 0.0
+    last = time.perf_counter()
+    while not done.is_set():
+        time.sleep(0.001)
+        now = time.perf_counter()
+        longest_stall = max(longest_stall, now - last)
+        last = now
+
+    future.result()
+    assert longest_stall < decode_time / 2
+
+
+@pytest.mark.skipif((os.cpu_count() or 1) < 2, reason="needs at least 2 CPUs")
+def test_load_images_decodes_in_parallel(canvas, tmp_path):
+    paths, _ = write_images(tmp_path, 8, 1500, 1500)
+    workers = min(4, os.cpu_count() or 1)
+
+    start = time.perf_counter()
+    canvas.load_images(paths, workers=1)
+    serial = time.perf_counter() - start
+
+    start = time.perf_counter()
+    canvas.load_images(paths, workers=workers)
+    parallel = time.perf_counter() - start
+
+    assert parallel < serial * 0.8
@@ -0,0 +1,50 @@
+import numpy as np
+from easyskia import Canvas, Shape
+
+
+def reset(c: Canvas):
+    c.background(1, 1, 1)
+    c.no_fill()
+    c.stroke(0, 0, 0)
+    c.stroke_weight(10)
+
+
+def dark_pixels(pixels: np.ndarray) -> int:
+    return int((pixels[:, :, :3].max(axis=2) < 128).sum())
+
+
+def test_shape_matches_direct_draw(canvas):
+    reset(canvas)
+    canvas.triangle(10, 10, 90, 50, 10, 90)
+    direct = canvas.canvas.toarray()
+
+    reset(canvas)
+    s = canvas.create_path().triangle(0, 0, 80, 40, 0, 80)
+    canvas.shape(s, 10, 10)
+
+    assert (canvas.canvas.toarray() == direct).all()
+
+
+def test_shape_miter_joins_are_not_culled(canvas):
+    reset(canvas)
+    canvas.push()
+    canvas.translate(-112, 50)
+    canvas.triangle(0, 0, 100, 36.4, 0, 72.8)
+    canvas.pop()
+    direct = canvas.canvas.toarray()
+
+    reset(canvas)
+    s = canvas.create_path().triangle(0, 0, 100, 36.4, 0, 72.8)
+    canvas.shape(s, -112, 50)
+
+    assert dark_pixels(direct) > 0
+    assert dark_pixels(canvas.canvas.toarray()) == dark_pixels(direct)
+
+
+def test_shape_bounds_follow_changes():
+    s = Shape().rect(0, 0, 10, 20)
+    assert s.bounds() == s.path.computeTightBounds()
+
+    s.line(0, 0, 50, 60)
+    assert s.bounds().right() == 50
+    assert s.bounds().bottom() == 60